@@ -6,7 +6,8 @@ import logging  # noqa: I001
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, ServiceCall
 from homeassistant.helpers.typing import ConfigType
 
 from .const import ATTR_USER_ID, DOMAIN
@@ -39,8 +40,25 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry=entry,  # Pass the full entry
     )
 
+    # Release the coordinator's timers and executor however the entry goes away
+    entry.async_on_unload(coordinator.async_shutdown)
+
+    async def handle_homeassistant_stop(event: Event):
+        """Write queued completions and release the executor on shutdown."""
+        await coordinator.async_flush_writes()
+        await coordinator.async_shutdown()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, handle_homeassistant_stop)
+    )
+
     # Fetch initial data so we have it when platforms are set up
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # Setup retries create a new coordinator, so don't leave this one running
+        await coordinator.async_shutdown()
+        raise
 
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
@@ -111,11 +129,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.services.async_remove(DOMAIN, SERVICE_COMPLETE_TASK)
         hass.services.async_remove(DOMAIN, SERVICE_INCOMPLETE_TASK)
 
-        # Stop the coordinator's scheduled refresh
+        # Write queued completions, then stop the coordinator's timers and executor
         coordinator: TaskDataCoordinator = hass.data[DOMAIN][entry.entry_id][
             "coordinator"
         ]
-        coordinator.stop_refresh = True
+        await coordinator.async_flush_writes()
+        await coordinator.async_shutdown()
 
         # Remove data for this entry
         hass.data[DOMAIN].pop(entry.entry_id)
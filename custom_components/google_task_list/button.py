@@ -10,6 +10,9 @@ from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 INTEGRATION_NAME = "google_task_list"
+_SLUG_TRANS = str.maketrans({" ": "_", "-": "_"})
+# Task fields used only by the coordinator, not exposed as entity attributes
+_INTERNAL_TASK_FIELDS = {"last_completed_ts"}
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -19,8 +22,9 @@ async def async_setup_entry(hass, entry, async_add_entities):
     category = entry.data.get("category", "Unknown")
     entity_prefix = entry.data.get("entity_prefix", "")
 
-    # Wait for the first refresh to have data
-    await coordinator.async_config_entry_first_refresh()
+    # The first refresh already ran in async_setup_entry; only fetch if it didn't
+    if coordinator.data is None:
+        await coordinator.async_config_entry_first_refresh()
 
     # Create a button for every task in the sheet
     async_add_entities(
@@ -50,16 +54,15 @@ class TaskButtonEntity(CoordinatorEntity, ButtonEntity):
         self._display_name = display_name
         self._category = category
 
-        base_slug = self.task_id.lower().replace(" ", "_").replace("-", "_")
-        prefix_slug = entity_prefix.lower().replace(" ", "_").replace("-", "_")
+        base_slug = self.task_id.lower().translate(_SLUG_TRANS)
+        prefix_slug = entity_prefix.lower().translate(_SLUG_TRANS)
 
         # Construct full entity slug
         full_slug = f"{prefix_slug}_{base_slug}" if prefix_slug else base_slug
 
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{full_slug}"
-        self._attr_name = f"{entity_prefix} {self.task_id}".strip()
-        self.entity_id = f"button.{full_slug}"
         self._attr_name = self.task_id
+        self.entity_id = f"button.{full_slug}"
 
         _LOGGER.debug(f"Registered button entity: {self.entity_id}")
 
@@ -99,11 +102,8 @@ class TaskButtonEntity(CoordinatorEntity, ButtonEntity):
         return True
 
     def _get_task_data(self) -> dict:
-        """Find this entity's specific task data from the coordinator's list."""
-        for task in self.coordinator.data:
-            if task.get("task") == self.task_id:
-                return task
-        return {}  # Return empty dict if not found
+        """Find this entity's specific task data from the coordinator's index."""
+        return self.coordinator._by_name.get(self.task_id, {})
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -118,7 +118,9 @@ class TaskButtonEntity(CoordinatorEntity, ButtonEntity):
         """Update the entity's internal state attributes from task data."""
         # Start with all task fields (includes extra columns like screentime, notes, etc.)
         task_data = self._get_task_data()
-        attributes = dict(task_data)
+        attributes = {
+            k: v for k, v in task_data.items() if k not in _INTERNAL_TASK_FIELDS
+        }
 
         # Add internal category if not already present
         attributes["category"] = self._category
@@ -128,7 +130,8 @@ class TaskButtonEntity(CoordinatorEntity, ButtonEntity):
     async def async_press(self):
         """Handle the button press by updating local state and firing an event."""
 
-        if self._pending_state:
+        # Covers both the local flag and a pending state shared via the coordinator
+        if self.state == "pending":
             _LOGGER.warning(f"Task '{self.task_id}' is already pending. Press ignored.")
             return
 
@@ -142,11 +145,7 @@ class TaskButtonEntity(CoordinatorEntity, ButtonEntity):
         self._pending_state = True
         self.async_write_ha_state()
 
-        for task in self.coordinator.data:
-            if task.get("task") == self.task_id:
-                task["state"] = "pending"
-                task["visible"] = True
-                break
+        self.coordinator.set_task_pending(self.task_id)
 
         event_type = "google_task_list_button_pressed"
         event_data = {
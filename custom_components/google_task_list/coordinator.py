@@ -1,13 +1,22 @@
 # coordinator.py
 
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_point_in_utc_time,
+    async_track_time_interval,
+)
 from homeassistant.core import HomeAssistant
-from datetime import datetime, timedelta, time, timezone
+from datetime import datetime, timedelta, time, timezone, tzinfo
 from zoneinfo import ZoneInfo
 from croniter import croniter
 from homeassistant.config_entries import ConfigEntry
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import copy
+import functools
 import logging
+import re
 
 # Changed import name to match class name
 from .google_sheet_clients import GoogleSheetsClient
@@ -15,38 +24,125 @@ from .google_sheet_clients import GoogleSheetsClient
 
 _LOGGER = logging.getLogger("custom_components.google_task_list")
 CENTRAL = ZoneInfo("America/Chicago")
+REFRESH_INTERVAL = timedelta(minutes=5)
+WRITE_DEBOUNCE_SECONDS = 1
+SHEETS_MAX_WORKERS = 4
+
+_EVERY_N_MINUTES = re.compile(r"(?:\*/(\d+)|\*) \* \* \* \*")
+_DAILY_AT_HOUR = re.compile(r"0 (\d+) \* \* \*")
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_cron(cron_expression: str) -> croniter | None:
+    """
+    Parses a cron expression once and caches the result.
+    Invalid expressions are cached as None so they are only logged once.
+    """
+    try:
+        return croniter(cron_expression, datetime(1970, 1, 1, tzinfo=timezone.utc))
+    except Exception as e:
+        _LOGGER.warning(f"Invalid cron expression '{cron_expression}': {e}")
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _simple_cron(cron_expression: str) -> tuple[str, int] | None:
+    """
+    Classifies cron expressions that can be evaluated without croniter.
+    Returns ("interval", seconds) for schedules that tick evenly within the hour,
+    ("daily", hour) for once-a-day schedules, or None for anything else.
+    """
+    expr = " ".join(cron_expression.split())
+    if expr in ("@hourly", "0 * * * *"):
+        return ("interval", 3600)
+    if expr in ("@daily", "@midnight"):
+        return ("daily", 0)
+
+    if match := _EVERY_N_MINUTES.fullmatch(expr):
+        minutes = int(match[1] or 1)
+        if 0 < minutes < 60 and 60 % minutes == 0:
+            return ("interval", minutes * 60)
+    elif match := _DAILY_AT_HOUR.fullmatch(expr):
+        hour = int(match[1])
+        if hour < 24:
+            return ("daily", hour)
+    return None
+
+
+def _simple_next_run(kind: str, value: int, start_time: datetime) -> datetime | None:
+    """
+    Computes the next run of a simple cron schedule with plain arithmetic.
+    Returns None when the fast path does not apply and croniter must be used.
+    """
+    if kind == "daily":
+        # Keeps start_time's tzinfo, so it compares with now by wall-clock time
+        next_run = start_time.replace(hour=value, minute=0, second=0, microsecond=0)
+        if next_run <= start_time:
+            next_run += timedelta(days=1)
+        return next_run
+
+    # Interval ticks line up with epoch multiples only if the UTC offset does too
+    if start_time.utcoffset().total_seconds() % value:
+        return None
+    next_tick = (start_time.timestamp() // value + 1) * value
+    return datetime.fromtimestamp(next_tick, tz=timezone.utc)
 
 
 def cron_run_required(
-    cron_expression: str | None, last_completed_str: str | None, now: datetime
+    cron_expression: str | None, last_completed_ts: int | None, now: datetime
 ) -> bool:
     """
-    Checks if a task is active due based on its cron expression and last completed timestamp.
+    Checks if a task is active due based on its cron expression and last completed
+    timestamp (unix epoch seconds, or None if never completed).
     """
     if not cron_expression:
         # One-time task. It's active if it has never been completed.
-        return last_completed_str is None
+        return last_completed_ts is None
+
+    next_run = _next_run(cron_expression, last_completed_ts, now.tzinfo)
+
+    # The task is active if its next scheduled run is on or before now.
+    return next_run is not None and next_run <= now
+
+
+@functools.lru_cache(maxsize=1024)
+def _next_run(
+    cron_expression: str, last_completed_ts: int | None, tz: tzinfo | None
+) -> datetime | None:
+    """
+    Returns the first scheduled run after the last completion, or None if it can't
+    be computed. It doesn't depend on the current time, so it stays cached across
+    refreshes until the task is completed again.
+    """
+    parsed = _parse_cron(cron_expression)
+    if parsed is None:
+        return None
 
     try:
         # Define a start point for the cron iteration
         # If the task was completed, start from that time.
         # Otherwise, start from a long time ago to find the first run.
         start_time = (
-            datetime.fromisoformat(last_completed_str).astimezone(now.tzinfo)
-            if last_completed_str
-            else datetime(1, 1, 1, tzinfo=now.tzinfo)
+            datetime.fromtimestamp(last_completed_ts, tz=tz)
+            if last_completed_ts is not None
+            else datetime(1, 1, 1, tzinfo=tz)
         )
 
-        # Get the next scheduled run time after the start time
-        iter = croniter(cron_expression, start_time)
-        next_run = iter.get_next(datetime)
+        simple = _simple_cron(cron_expression)
+        if simple is not None:
+            next_run = _simple_next_run(*simple, start_time)
+            if next_run is not None:
+                return next_run
 
-        # The task is active if its next scheduled run is on or before now.
-        return next_run <= now
+        # Get the next scheduled run time after the start time, reusing the
+        # already-expanded fields of the cached iterator.
+        iter = copy.copy(parsed)
+        iter.set_current(start_time, force=True)
+        return iter.get_next(datetime)
 
     except Exception as e:
-        _LOGGER.warning(f"Invalid cron expression '{cron_expression}': {e}")
-        return False
+        _LOGGER.warning(f"Could not evaluate cron expression '{cron_expression}': {e}")
+        return None
 
 
 class TaskDataCoordinator(DataUpdateCoordinator):
@@ -68,7 +164,27 @@ class TaskDataCoordinator(DataUpdateCoordinator):
         self.client = GoogleSheetsClient(
             creds_path, sheet_name, task_worksheet, log_worksheet
         )
-        self.stop_refresh = False
+        # Unsubscribe callback for whichever refresh timer is currently active
+        self._unsub_refresh = None
+        # Dedicated pool so slow Sheets calls don't tie up Home Assistant's executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=SHEETS_MAX_WORKERS, thread_name_prefix="gtl_sheets"
+        )
+        # Index of task name -> task dict, rebuilt whenever data changes
+        self._by_name: dict[str, dict] = {}
+        # Drive modifiedTime of the sheet the current data was read from.
+        # Cleared when a write doesn't land, so the next refresh re-reads the sheet.
+        self._sheet_modified: str | None = None
+        # Positions of tasks with a cron in the current data
+        self._recurring_tasks: list[int] = []
+
+        # Sheet writes queued for the next debounced flush.
+        # Status updates are keyed by task name so only the latest value wins.
+        self._pending_status: dict[str, str] = {}
+        self._pending_logs: list[list[str]] = []
+        self._unsub_flush = None
+        # Held while a flush runs, so refreshes wait for writes already in flight
+        self._flush_lock = asyncio.Lock()
 
         # Start the background refresh loop
         self._schedule_five_minutely_refresh()
@@ -76,62 +192,106 @@ class TaskDataCoordinator(DataUpdateCoordinator):
     def _schedule_five_minutely_refresh(self):
         """Schedule refresh every 5 minutes aligned to clock time."""
         now = datetime.now(timezone.utc)
-        next_run = (now + timedelta(minutes=5)).replace(second=0, microsecond=0)
+        next_run = (now + REFRESH_INTERVAL).replace(second=0, microsecond=0)
         minute = next_run.minute - (next_run.minute % 5)
         next_run = next_run.replace(minute=minute)
 
-        _LOGGER.debug(f"Next 5-min refresh scheduled at {next_run.isoformat()}")
+        _LOGGER.debug(f"First 5-min refresh scheduled at {next_run.isoformat()}")
+
+        # Align to the clock once, then let a single interval timer take over
+        self._unsub_refresh = async_track_point_in_utc_time(
+            self.hass, self._start_refresh_interval, next_run
+        )
 
-        async_track_point_in_utc_time(
-            self.hass, self._handle_scheduled_refresh, next_run
+    async def _start_refresh_interval(self, now):
+        self._unsub_refresh = async_track_time_interval(
+            self.hass, self._handle_scheduled_refresh, REFRESH_INTERVAL
         )
+        await self._handle_scheduled_refresh(now)
 
     async def _handle_scheduled_refresh(self, now):
-        if self.stop_refresh:
-            _LOGGER.info("Scheduled refresh skipped due to unload")
-            return
         _LOGGER.info("Running scheduled 5-minute task refresh")
         await self.async_refresh()
-        self._schedule_five_minutely_refresh()
+
+    def stop_scheduled_refresh(self):
+        """Cancel the scheduled refresh timer."""
+        if self._unsub_refresh is not None:
+            self._unsub_refresh()
+            self._unsub_refresh = None
+
+    async def _async_run_sheets_job(self, target, *args):
+        """Run a blocking Google Sheets call on the coordinator's own executor."""
+        return await self.hass.loop.run_in_executor(self._executor, target, *args)
+
+    async def async_shutdown(self) -> None:
+        """Cancel all timers and release the Sheets executor. Safe to call twice."""
+        await super().async_shutdown()
+        self.stop_scheduled_refresh()
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        # Don't wait for running calls; gspread requests have no timeout
+        self._executor.shutdown(wait=False)
 
     async def _async_update_data(self):
         """Fetch updated task list and re-evaluate state only when necessary."""
+        # Make sure queued completions reach the sheet before reading it back
+        await self.async_flush_writes()
+
         try:
             # Get the previous data to check for existing tasks and their states.
-            previous_data_by_name = (
-                {task.get("task"): task for task in self.data} if self.data else {}
-            )
-            await self.hass.async_add_executor_job(self.client.load_sheet)
-            _LOGGER.debug("Fetching tasks from Google Sheets")
-
-            raw_tasks = await self.hass.async_add_executor_job(self.client.get_tasks)
+            previous_data_by_name = self._by_name
+            modified = await self._async_run_sheets_job(self.client.load_sheet)
+
+            if modified is None or modified != self._sheet_modified or not self.data:
+                _LOGGER.debug("Fetching tasks from Google Sheets")
+                raw_tasks = await self._async_run_sheets_job(self.client.get_tasks)
+                recurring_tasks = [
+                    i
+                    for i, task in enumerate(raw_tasks)
+                    if task["cron_frequency"] is not None
+                ]
+            else:
+                # Nothing changed in the sheet; only re-evaluate cron schedules
+                _LOGGER.debug("Sheet unchanged since last fetch, reusing tasks")
+                raw_tasks = list(self.data)
+                recurring_tasks = self._recurring_tasks
 
-            updated_tasks = []
             for task in raw_tasks:
-                task_name = task.get("task", "Unnamed")
-                previous_task = previous_data_by_name.get(task_name, {})
+                previous_task = previous_data_by_name.get(task["task"], {})
                 # Default to previously known values if available
                 task["state"] = previous_task.get("state", "not_completed")
                 task["visible"] = previous_task.get("visible", True)
-                last_completed = task.get("last_completed", "")
-                cron = task.get("cron_frequency")
 
-                if (
-                    task["state"] == "completed"
-                    and cron is not None
-                    and cron_run_required(cron, last_completed, datetime.now(CENTRAL))
+                # A completion that has not reached the sheet yet still counts
+                pending_value = self._pending_status.get(task["task"])
+                if pending_value is not None:
+                    task["last_completed"] = pending_value
+                    task["last_completed_ts"] = int(
+                        datetime.fromisoformat(pending_value).timestamp()
+                    )
+
+            # Only tasks with a cron can become due again
+            now_central = datetime.now(CENTRAL)
+            for index in recurring_tasks:
+                task = raw_tasks[index]
+                cron = task["cron_frequency"]
+
+                if task["state"] == "completed" and cron_run_required(
+                    cron, task["last_completed_ts"], now_central
                 ):
                     task["visible"] = True
                     task["state"] = "not_completed"
                     _LOGGER.debug(
                         "Task '%s' was updated to due based on cron '%s'.",
-                        task_name,
+                        task["task"],
                         cron,
                     )
 
-                updated_tasks.append(task)
-
-            return updated_tasks
+            self._by_name = {t["task"]: t for t in raw_tasks}
+            self._sheet_modified = modified
+            self._recurring_tasks = recurring_tasks
+            return raw_tasks
 
         except Exception as err:
             _LOGGER.warning("Failed to update tasks: %s", err)
@@ -143,12 +303,7 @@ class TaskDataCoordinator(DataUpdateCoordinator):
 
         try:
             updated_tasks = list(self.data)
-            found_task = None
-
-            for task in updated_tasks:
-                if task.get("task") == task_name:
-                    found_task = task
-                    break
+            found_task = self._by_name.get(task_name)
 
             if not found_task:
                 _LOGGER.warning(f"Task '{task_name}' not found.")
@@ -157,26 +312,89 @@ class TaskDataCoordinator(DataUpdateCoordinator):
             # Set new task values
             found_task["state"] = "completed"
             found_task["visible"] = False
-            now = datetime.now(CENTRAL).isoformat(timespec="seconds")
+            completed_at = datetime.now(CENTRAL)
+            now = completed_at.isoformat(timespec="seconds")
             found_task["last_completed"] = now
+            found_task["last_completed_ts"] = int(completed_at.timestamp())
 
             # Update HA state
             self.async_set_updated_data(updated_tasks)
 
-            # Google Sheet updates
-            await self.hass.async_add_executor_job(
-                self.client.update_task_status, task_name, now
-            )
-
-            await self.hass.async_add_executor_job(
-                self.client.log_action, task_name, "completed", user_id
+            # Queue Google Sheet updates; they are flushed together shortly after
+            self._pending_status[task_name] = now
+            self._pending_logs.append(
+                self.client.make_log_row(task_name, "completed", user_id)
             )
+            self._schedule_write_flush()
 
             _LOGGER.info(f"Task '{task_name}' completed by '{user_id}'.")
 
         except Exception as err:
             _LOGGER.error(f"Error completing task '{task_name}': {err}")
 
+    def _schedule_write_flush(self):
+        """Debounce queued sheet writes into a single batch."""
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self.hass, WRITE_DEBOUNCE_SECONDS, self._handle_write_flush
+            )
+
+    async def _handle_write_flush(self, now):
+        self._unsub_flush = None
+        await self.async_flush_writes()
+
+    async def async_flush_writes(self):
+        """Send all queued status updates and log rows to the sheet."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+
+        async with self._flush_lock:
+            updates, self._pending_status = self._pending_status, {}
+            log_rows, self._pending_logs = self._pending_logs, []
+            if not updates and not log_rows:
+                return
+
+            try:
+                if updates:
+                    missing = await self._async_run_sheets_job(
+                        self.client.update_task_statuses, updates
+                    )
+                    if missing:
+                        # Local data no longer matches the sheet; re-read it next time
+                        self._sheet_modified = None
+            except Exception as err:
+                self._sheet_modified = None
+                _LOGGER.error(f"Error writing task(s) {list(updates)} to sheet: {err}")
+                # Re-queue for the next flush; values queued meanwhile are newer
+                for task_name, value in updates.items():
+                    self._pending_status.setdefault(task_name, value)
+                self._pending_logs[:0] = log_rows
+                return
+
+            try:
+                if log_rows:
+                    await self._async_run_sheets_job(self.client.log_actions, log_rows)
+            except Exception as err:
+                _LOGGER.error(f"Error logging {len(log_rows)} row(s) to sheet: {err}")
+                # Only resend rows that certainly weren't appended, to avoid duplicates
+                if self.client.append_was_rejected(err):
+                    self._pending_logs[:0] = log_rows
+                return
+
+            _LOGGER.debug(f"Flushed sheet writes for task(s): {list(updates)}")
+
+    def set_task_pending(self, task_name: str):
+        """Mark a task as pending and notify all entities in one update."""
+        task = self._by_name.get(task_name)
+        if task is None:
+            _LOGGER.warning(f"Task '{task_name}' not found in coordinator data.")
+            return
+
+        task["state"] = "pending"
+        task["visible"] = True
+        self.async_set_updated_data(self.data)
+
     async def async_incomplete_pending_task(self, task_name: str):
         """Return a pending task to a not_completed state."""
         _LOGGER.info(f"Returning task '{task_name}' from pending to not_completed.")
@@ -185,13 +403,7 @@ class TaskDataCoordinator(DataUpdateCoordinator):
             # Create a mutable copy of the current data.
             # This is important so you don't modify the data while it's being used.
             updated_tasks = list(self.data)
-            found_task = None
-
-            # Find the task in the list
-            for task in updated_tasks:
-                if task.get("task") == task_name:
-                    found_task = task
-                    break
+            found_task = self._by_name.get(task_name)
 
             if found_task:
                 # Modify the task's state directly.
@@ -1,12 +1,86 @@
 # google_sheets_client.py
 
 import gspread
+from gspread.utils import absolute_range_name, numericise_all, rowcol_to_a1
 from google.oauth2.service_account import Credentials
 from datetime import datetime
+import functools
 import logging
+import time
 
 _LOGGER = logging.getLogger(__name__)
 
+SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive",
+]
+RETRY_STATUS_CODES = (429, 500, 503)
+# An append that failed with these was never applied, so it is safe to resend
+APPEND_RETRY_STATUS_CODES = (429,)
+
+# Known task fields and their defaults, in the order they appear on each task
+TASK_DEFAULTS = {
+    "task": "",
+    "assigned_to": "unknown",
+    "cron_frequency": None,
+    "last_completed": "",
+    "visible": True,
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _get_client(path_to_creds: str) -> gspread.Client:
+    """Load service-account credentials and authorize gspread once per creds file."""
+    creds = Credentials.from_service_account_file(path_to_creds, scopes=SCOPES)
+    return gspread.authorize(creds)
+
+
+def _retry(
+    tries: int = 5,
+    base: float = 1.0,
+    max_delay: float = 30,
+    statuses: tuple[int, ...] = RETRY_STATUS_CODES,
+):
+    """
+    Retry a Sheets call with exponential backoff on rate-limit and transient errors.
+    Only use on methods that run in an executor thread, since it sleeps.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(tries):
+                try:
+                    return func(*args, **kwargs)
+                except gspread.exceptions.APIError as e:
+                    status = e.response.status_code
+                    if status not in statuses or attempt == tries - 1:
+                        raise
+                    delay = min(max_delay, base * 2**attempt)
+                    retry_after = e.response.headers.get("Retry-After")
+                    if retry_after and retry_after.isdigit():
+                        delay = min(max_delay, max(delay, int(retry_after)))
+                    _LOGGER.warning(
+                        f"Google API returned {status} in {func.__name__}, "
+                        f"retrying in {delay:.0f}s ({attempt + 1}/{tries - 1})"
+                    )
+                    time.sleep(delay)
+
+        return wrapper
+
+    return decorator
+
+
+def _to_timestamp(value) -> int | None:
+    """Convert an ISO 'Last Completed' value to unix epoch seconds, or None."""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return int(datetime.fromisoformat(value).timestamp())
+    except ValueError:
+        _LOGGER.warning(f"Invalid Last Completed timestamp '{value}'")
+        return None
+
 
 class GoogleSheetsClient:
     def __init__(
@@ -16,12 +90,7 @@ class GoogleSheetsClient:
         task_worksheet: str,
         log_worksheet: str,
     ):
-        SCOPES = [
-            "https://www.googleapis.com/auth/spreadsheets",
-            "https://www.googleapis.com/auth/drive",
-        ]
-        self.creds = Credentials.from_service_account_file(path_to_creds, scopes=SCOPES)
-        self.client = gspread.authorize(self.creds)
+        self.client = _get_client(path_to_creds)
         self.sheet_name = sheet_name
         self.task_worksheet = task_worksheet
         self.log_worksheet = log_worksheet
@@ -30,49 +99,69 @@ class GoogleSheetsClient:
         self.task_ws = None
         self.log_ws = None
 
-    def load_sheet(self):
-        """Load the Google Sheet and worksheets — runs in executor thread."""
+        # Cached sheet layout, rebuilt on every get_tasks()
+        self._last_completed_col: int | None = None
+        self._task_col: int | None = None
+        self._row_by_task: dict[str, int] = {}
+
+    @_retry()
+    def load_sheet(self) -> str | None:
+        """
+        Load the Google Sheet and worksheets — runs in executor thread.
+        Returns the spreadsheet's Drive modifiedTime, if known.
+        """
         self.sheet = self.client.open(self.sheet_name)
         self.task_ws = self.sheet.worksheet(self.task_worksheet)
         self.log_ws = self.sheet.worksheet(self.log_worksheet)
 
+        # open() already got modifiedTime from its Drive files.list call; reading it
+        # here avoids the extra request get_lastUpdateTime() would make.
+        return self.sheet._properties.get("modifiedTime")
+
+    @_retry()
     def get_tasks(self) -> list[dict]:
         """Load task rows from the task worksheet into dictionaries with normalized lowercase keys."""
-        tasks = self.task_ws.get_all_records()
+        # One values request for the whole worksheet; row 1 is the header
+        raw = self.sheet.values_get(absolute_range_name(self.task_worksheet))
+        rows = raw.get("values", [])
+        header = [h.strip().lower() for h in rows[0]] if rows else []
+        duplicates = sorted({h for h in header if header.count(h) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate column header(s): {', '.join(duplicates)}")
+        width = len(header)
         normalized = []
 
-        for task in tasks:
-            cleaned_task = {}
-
-            # First, lowercase all keys
+        for row in rows[1:]:
+            # Keys come from the pre-lowercased header; pad short rows like gspread does
+            values = numericise_all(row + [""] * (width - len(row)))
             task_lower = {
-                k.lower(): v.strip() if isinstance(v, str) else v
-                for k, v in task.items()
+                k: v.strip() if isinstance(v, str) else v
+                for k, v in zip(header, values)
             }
 
-            # Normalize known fields
-            cleaned_task["task"] = task_lower.get("task", "")
-            cleaned_task["assigned_to"] = task_lower.get("assigned_to", "unknown")
-            cleaned_task["cron_frequency"] = task_lower.get("cron_frequency") or None
-            cleaned_task["last_completed"] = task_lower.get("last_completed", "")
-            cleaned_task["visible"] = task_lower.get("visible", True)
-
-            # Add any remaining fields
-            for k, v in task_lower.items():
-                if k not in cleaned_task:
-                    cleaned_task[k] = v
+            # Known fields first (with defaults), then any remaining columns
+            cleaned_task = {**TASK_DEFAULTS, **task_lower}
+            cleaned_task["cron_frequency"] = cleaned_task["cron_frequency"] or None
+            cleaned_task["last_completed_ts"] = _to_timestamp(
+                cleaned_task["last_completed"]
+            )
             normalized.append(cleaned_task)
 
         if not normalized:
             raise ValueError("No tasks found in sheet")
 
-        required_fields = {"task", "cron_frequency", "last_completed"}
-        found_fields = set(normalized[0].keys())
+        required_fields = {"task", "last_completed"}
+        found_fields = set(header)
 
         missing_fields = required_fields - found_fields
         if missing_fields:
             raise ValueError(f"Missing required column(s): {', '.join(missing_fields)}")
 
+        # Row 1 is the header, so the first record lives on row 2.
+        self._last_completed_col = header.index("last_completed") + 1
+        self._task_col = header.index("task") + 1
+        self._row_by_task = {task["task"]: i + 2 for i, task in enumerate(normalized)}
+
         return normalized
 
     def update_task_status(self, task_name: str, last_completed_str: str):
@@ -83,46 +172,132 @@ class GoogleSheetsClient:
             last_completed_str (str): The timestamp string to update 'Last Completed' with.
             Use an empty string to clear the value.
         """
+        self.update_task_statuses({task_name: last_completed_str})
 
-        _LOGGER.debug(f"Updating status for task '{task_name}'...")
-        cell = self.task_ws.find(task_name)
-        if not cell:
-            _LOGGER.warning(f"Could not find task '{task_name}' to update.")
-            return
+    @_retry()
+    def update_task_statuses(self, updates: dict[str, str]) -> list[str]:
+        """
+        Updates the 'Last Completed' column for several tasks in one batch request.
+        Args:
+            updates (dict[str, str]): Mapping of task name to timestamp string.
+        Returns:
+            list[str]: Names of tasks that could not be found in the sheet.
+        """
+        _LOGGER.debug(f"Updating status for {len(updates)} task(s)...")
 
-        row_index = cell.row
-        header = self.task_ws.row_values(1)
-        header_lower = [h.strip().lower() for h in header]
+        if self._last_completed_col is None or self._task_col is None:
+            # get_tasks() has not cached the columns yet, so read the header directly
+            self._resolve_columns()
+
+        rows = self._find_task_rows(list(updates))
+        data = []
+        missing = []
+        for task_name, last_completed_str in updates.items():
+            row_index = rows.get(task_name)
+            if row_index is None:
+                _LOGGER.warning(f"Could not find task '{task_name}' to update.")
+                missing.append(task_name)
+                continue
+            data.append(
+                {
+                    "range": rowcol_to_a1(row_index, self._last_completed_col),
+                    "values": [[last_completed_str]],
+                }
+            )
+
+        if not data:
+            return missing
 
         try:
-            last_completed_col_index = header_lower.index("last_completed") + 1
+            self.task_ws.batch_update(data, value_input_option="USER_ENTERED")
+        except Exception as e:
+            _LOGGER.error(
+                f"Google API error while updating task(s) {list(updates)}: {e}"
+            )
+            raise
+
+        _LOGGER.debug(f"Updated Last Completed for task(s): {list(updates)}")
+        return missing
+
+    def _resolve_columns(self):
+        """Locate the Task and Last Completed columns from the header row."""
+        header = [h.strip().lower() for h in self.task_ws.row_values(1)]
+        try:
+            self._last_completed_col = header.index("last_completed") + 1
+            self._task_col = header.index("task") + 1
         except ValueError as e:
             _LOGGER.error(f"Could not find column header: {e}")
             raise Exception(
-                f"Could not find required column 'Last Completed' in sheet header."
+                f"Could not find required columns 'Task' and 'Last Completed' in sheet header."
             )
 
-        try:
-            self.task_ws.update_cell(
-                row_index, last_completed_col_index, last_completed_str
-            )
-        except Exception as e:
-            _LOGGER.error(f"Google API error while updating task '{task_name}': {e}")
-            raise
+    def _find_task_rows(self, task_names: list[str]) -> dict[str, int]:
+        """
+        Return the sheet row of each task that can be found.
+        The cached header cells and task rows are checked against the live sheet in
+        one request, since columns or rows may have moved since the last read.
+        """
+        cached = {
+            name: self._row_by_task[name]
+            for name in task_names
+            if name in self._row_by_task
+        }
+        ranges = [
+            rowcol_to_a1(1, self._last_completed_col),
+            rowcol_to_a1(1, self._task_col),
+        ] + [rowcol_to_a1(row, self._task_col) for row in cached.values()]
+        cells = [
+            str(value[0][0]).strip() if value and value[0] else ""
+            for value in self.task_ws.batch_get(ranges)
+        ]
 
-        _LOGGER.debug(
-            f"Updated task '{task_name}' with Last Completed: '{last_completed_str}'"
-        )
+        rows = {}
+        if [h.lower() for h in cells[:2]] == ["last_completed", "task"]:
+            for (name, row), value in zip(cached.items(), cells[2:]):
+                if value == name:
+                    rows[name] = row
+        else:
+            # Columns were moved since the last read; the cached rows can't be
+            # trusted either, so they are all looked up again below
+            _LOGGER.debug("Sheet header changed since the last read, re-reading it")
+            self._resolve_columns()
+
+        for name in task_names:
+            if name in rows:
+                continue
+            # Not cached, or the cached row now holds a different task
+            self._row_by_task.pop(name, None)
+            cell = self.task_ws.find(name)
+            if cell:
+                rows[name] = self._row_by_task[name] = cell.row
+        return rows
+
+    @staticmethod
+    def make_log_row(task_name: str, action: str, user: str = "unknown") -> list[str]:
+        """Build a log row with timestamp, task, user, and action."""
+        timestamp = datetime.now().isoformat(timespec="seconds")
+        return [timestamp, task_name, user, action]
 
     def log_action(self, task_name: str, action: str, user: str = "unknown"):
         """Append a log row with timestamp, task, user, and action (Central Time)."""
         _LOGGER.debug(f"Logging action '{action}' for task '{task_name}'...")
-        timestamp = datetime.now().isoformat(timespec="seconds")
-        row = [timestamp, task_name, user, action]
+        self.log_actions([self.make_log_row(task_name, action, user)])
 
+    # A 500/503 may come back after the append was applied, so only retry 429s
+    @_retry(statuses=APPEND_RETRY_STATUS_CODES)
+    def log_actions(self, rows: list[list[str]]):
+        """Append several log rows in a single request."""
         try:
-            self.log_ws.append_row(row, value_input_option="RAW")
+            self.log_ws.append_rows(rows, value_input_option="RAW")
 
         except Exception as e:
-            _LOGGER.error(f"Google API error while logging '{task_name}': {e}")
+            _LOGGER.error(f"Google API error while logging {len(rows)} row(s): {e}")
             raise
+
+    @staticmethod
+    def append_was_rejected(err: Exception) -> bool:
+        """Return True if a failed log append is known not to have been applied."""
+        return (
+            isinstance(err, gspread.exceptions.APIError)
+            and err.response.status_code in APPEND_RETRY_STATUS_CODES
+        )